@@ -36,25 +36,32 @@ public class GameServer {
         while (true) {
             try {
                 List<String> toRemove = new ArrayList<>();
+                // All updates for this tick, newline-separated, sent in one write per client
+                StringBuilder batch = new StringBuilder();
                 
-                // Update all projectiles and broadcast their new positions
+                // Update all projectiles and queue their new positions
                 for (Map.Entry<String, Projectile> entry : projectiles.entrySet()) {
                     Projectile projectile = entry.getValue();
                     if (!projectile.update()) {
                         toRemove.add(entry.getKey());
                     } else {
-                        // Broadcast updated position to all clients
-                        broadcastToAll("PROJECTILE_UPDATE:" + projectile.id + ":" + 
-                                     projectile.x + ":" + projectile.y + ":" + 
-                                     projectile.directionX + ":" + projectile.directionY + ":" + 
-                                     projectile.ownerId);
+                        batch.append("PROJECTILE_UPDATE:").append(projectile.id).append(':')
+                             .append(projectile.x).append(':').append(projectile.y).append(':')
+                             .append(projectile.directionX).append(':').append(projectile.directionY).append(':')
+                             .append(projectile.ownerId).append('\n');
                     }
                 }
                 
                 // Remove expired projectiles
                 for (String projectileId : toRemove) {
                     projectiles.remove(projectileId);
-                    broadcastToAll("PROJECTILE_REMOVE:" + projectileId);
+                    batch.append("PROJECTILE_REMOVE:").append(projectileId).append('\n');
+                }
+                
+                // Broadcast the whole tick at once (println supplies the final newline)
+                if (batch.length() > 0) {
+                    batch.setLength(batch.length() - 1);
+                    broadcastToAll(batch.toString());
                 }
                 
                 Thread.sleep(16); // ~60 FPS
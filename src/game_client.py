@@ -1,17 +1,33 @@
+import logging
 import pygame
+import time
+from collections import deque
 from game_constants import *
 from network_client import NetworkClient
 from game_renderer import GameRenderer
 from input_handler import InputHandler
-from projectile_system import ProjectileManager, Projectile
+from projectile_system import ProjectileManager
+from spatial_hash import SpatialHashGrid
+
+log = logging.getLogger(__name__)
 
 # Initialize Pygame
 pygame.init()
 
+# Window damage events; the whole frame must be repainted after one
+REPAINT_EVENT_TYPES = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+# Event types processed by the main loop; everything else is blocked
+HANDLED_EVENT_TYPES = [pygame.QUIT, pygame.KEYDOWN, *REPAINT_EVENT_TYPES]
+
 class GameClient:
     def __init__(self):
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("Multiplayer Squares Game")
+        # Only queue the events the loop handles; keyboard and mouse state
+        # are polled, so motion/button events would just be discarded
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENT_TYPES)
         self.clock = pygame.time.Clock()
         
         # Initialize components
@@ -19,9 +35,19 @@ class GameClient:
         self.renderer = GameRenderer(self.screen)
         self.input_handler = InputHandler()
         self.projectile_manager = ProjectileManager()
+        self.player_grid = SpatialHashGrid(COLLISION_GRID_CELL_SIZE)
+        
+        # (player_id, x, y) for every other player, rebuilt only when players change
+        self._player_entries = []
+        self._player_entries_version = None  # players_version the entries were built from
+        
+        # (apply_method, data) projectile changes queued by the network thread
+        self._projectile_events = deque()
         
         # Game state
-        self.frame_count = 0
+        self.frame_count = 0  # simulation ticks run so far
+        self._sim_accumulator = 0.0  # frame time not yet consumed by simulation ticks
+        self._needs_redraw = True  # set whenever something visible changes
         
         # Set up network callbacks
         self.network_client.set_callbacks(
@@ -39,31 +65,57 @@ class GameClient:
         
     def _on_welcome(self, player_id, x, y, color):
         """Callback for when we receive welcome message from server."""
-        print(f"Welcome callback: {player_id} at ({x}, {y}) with color {color}")
+        log.debug("Welcome callback: %s at (%s, %s) with color %s", player_id, x, y, color)
+        self._needs_redraw = True
         
     def _on_player_update(self, other_players):
         """Callback for when player data is updated."""
-        pass  # No specific action needed, data is already updated in network_client
+        # Data is already updated in network_client; just schedule a redraw
+        self._needs_redraw = True
         
     def _on_new_player(self, player_id, x, y, color):
         """Callback for when a new player joins."""
-        print(f"New player joined: {player_id}")
+        log.debug("New player joined: %s", player_id)
         
     def _on_player_left(self, player_id):
         """Callback for when a player leaves."""
-        print(f"Player left: {player_id}")
+        log.debug("Player left: %s", player_id)
         
     def _on_disconnect(self):
         """Callback for when disconnected from server."""
-        print("Disconnected from server!")
+        log.debug("Disconnected from server!")
         
     def _on_projectile_update(self, projectile_data):
         """Callback for when a projectile is created or updated."""
+        # Runs on the network thread; applied on the main thread by _process_projectile_events()
+        self._projectile_events.append((self._apply_projectile_update, projectile_data))
+    
+    def _on_projectile_remove(self, projectile_id):
+        """Callback for when a projectile should be removed."""
+        # Runs on the network thread; applied on the main thread by _process_projectile_events()
+        self._projectile_events.append((self._apply_projectile_remove, projectile_id))
+    
+    def _process_projectile_events(self):
+        """
+        Apply queued projectile updates and removals from the network thread.
+        Pooled Projectile instances are only released and reused here, on the
+        main thread, so check_collisions never sees one recycled mid-frame.
+        """
+        events = self._projectile_events
+        if not events:
+            return
+        while events:
+            apply, data = events.popleft()
+            apply(data)
+        self._needs_redraw = True
+    
+    def _apply_projectile_update(self, projectile_data):
+        """Create or update a projectile from server data."""
         # Create or update projectile in our local manager
         projectile = self.projectile_manager.projectiles.get(projectile_data['id'])
         if not projectile:
-            # Create new projectile
-            projectile = Projectile(
+            # Create new projectile (reuses a pooled instance when available)
+            self.projectile_manager.add_projectile(
                 projectile_data['id'],
                 projectile_data['x'],
                 projectile_data['y'],
@@ -71,14 +123,13 @@ class GameClient:
                 projectile_data['direction_y'],
                 projectile_data['owner_id']
             )
-            self.projectile_manager.projectiles[projectile_data['id']] = projectile
         else:
             # Update existing projectile
             projectile.x = projectile_data['x']
             projectile.y = projectile_data['y']
     
-    def _on_projectile_remove(self, projectile_id):
-        """Callback for when a projectile should be removed."""
+    def _apply_projectile_remove(self, projectile_id):
+        """Remove a projectile the server has retired."""
         self.projectile_manager.remove_projectile(projectile_id)
         
     def connect_to_server(self):
@@ -89,39 +140,78 @@ class GameClient:
         """Check for collisions between projectiles and players."""
         hits_to_process = []
         
+        # Refresh player entries (and the grid) only if a player joined, left or moved
+        players_version = self.network_client.players_version
+        if players_version != self._player_entries_version:
+            self._refresh_player_entries(players_version)
+        player_entries = self._player_entries
+        use_grid = len(player_entries) >= COLLISION_GRID_MIN_PLAYERS
+        
+        # Bind per-frame values and hot methods to locals once
+        network_client = self.network_client
+        local_id = network_client.player_id
+        local_x = network_client.player_x
+        local_y = network_client.player_y
+        collides = self._check_projectile_player_collision
+        grid_query = self.player_grid.query
+        add_hit = hits_to_process.append
+        
         for projectile_id, projectile in list(self.projectile_manager.projectiles.items()):
-            # Check collision with our own player (if projectile is not ours)
-            if projectile.owner_id != self.network_client.player_id:
-                if self._check_projectile_player_collision(
-                    projectile, 
-                    self.network_client.player_x, 
-                    self.network_client.player_y
-                ):
-                    hits_to_process.append((self.network_client.player_id, projectile.owner_id, projectile_id))
-            
-            # Check collision with other players (if projectile is ours)
-            if projectile.owner_id == self.network_client.player_id:
-                for other_player_id, other_player in self.network_client.other_players.items():
-                    if self._check_projectile_player_collision(
-                        projectile,
-                        other_player['x'],
-                        other_player['y']
-                    ):
-                        hits_to_process.append((other_player_id, projectile.owner_id, projectile_id))
-        
-        # Process all hits
+            owner_id = projectile.owner_id
+            if owner_id != local_id:
+                # Check collision with our own player (projectile is not ours)
+                if collides(projectile, local_x, local_y):
+                    add_hit((local_id, owner_id, projectile_id))
+            else:
+                # Check collision with other players (projectile is ours)
+                if use_grid:
+                    candidates = grid_query(
+                        projectile.x - PROJECTILE_HALF_SIZE,
+                        projectile.y - PROJECTILE_HALF_SIZE,
+                        PROJECTILE_SIZE, PROJECTILE_SIZE
+                    )
+                else:
+                    candidates = player_entries
+                for other_player_id, other_x, other_y in candidates:
+                    if collides(projectile, other_x, other_y):
+                        add_hit((other_player_id, owner_id, projectile_id))
+        
+        if not hits_to_process:
+            return
+        
+        # Report all hits in one batch, then process them locally
+        network_client.send_hits(hits_to_process)
+        remove_projectile = self.projectile_manager.remove_projectile
         for victim_id, shooter_id, projectile_id in hits_to_process:
-            self.network_client.send_hit(victim_id, shooter_id, projectile_id)
             # Remove the projectile locally
-            self.projectile_manager.remove_projectile(projectile_id)
+            remove_projectile(projectile_id)
+        self._needs_redraw = True
+    
+    def _refresh_player_entries(self, players_version):
+        """
+        Rebuild the (player_id, x, y) entries for other players, and bucket them
+        into the grid when there are enough players for it to pay off.
+        """
+        entries = [(other_player_id, other_player['x'], other_player['y'])
+                   for other_player_id, other_player in list(self.network_client.other_players.items())]
+        
+        self.player_grid.clear()
+        if len(entries) >= COLLISION_GRID_MIN_PLAYERS:
+            for entry in entries:
+                self.player_grid.insert(entry[1], entry[2], PLAYER_SIZE, PLAYER_SIZE, entry)
+        
+        self._player_entries = entries
+        self._player_entries_version = players_version
     
     def _check_projectile_player_collision(self, projectile, player_x, player_y):
         """Check if a projectile collides with a player."""
         # Get projectile bounds
-        proj_left = projectile.x - PROJECTILE_SIZE // 2
-        proj_right = projectile.x + PROJECTILE_SIZE // 2
-        proj_top = projectile.y - PROJECTILE_SIZE // 2
-        proj_bottom = projectile.y + PROJECTILE_SIZE // 2
+        proj_x = projectile.x
+        proj_y = projectile.y
+        proj_left = proj_x - PROJECTILE_HALF_SIZE
+        proj_right = proj_x + PROJECTILE_HALF_SIZE
+        proj_top = proj_y - PROJECTILE_HALF_SIZE
+        proj_bottom = proj_y + PROJECTILE_HALF_SIZE
         
         # Get player bounds
         player_left = player_x
@@ -133,20 +223,21 @@ class GameClient:
         return (proj_left < player_right and proj_right > player_left and
                 proj_top < player_bottom and proj_bottom > player_top)
     
-    def handle_input(self):
-        """Handle player input and send movement updates."""
+    def handle_input(self, keys=None):
+        """Handle player input: move the local player and send shots."""
         # Handle movement WITH COLLISION DETECTION
         new_x, new_y, moved = self.input_handler.handle_input(
             self.network_client.player_x, 
             self.network_client.player_y,
-            self.network_client.other_players  # Pass other players for collision check
+            self.network_client.other_players,  # Pass other players for collision check
+            keys
         )
         
-        # Send update if position changed
+        # Update the local position; it is sent to the server on the network tick
         if moved:
             self.network_client.player_x = new_x
             self.network_client.player_y = new_y
-            self.network_client.send_move(new_x, new_y)
+            self._needs_redraw = True
         
         # Handle shooting
         should_shoot, target_x, target_y, direction_x, direction_y = self.input_handler.check_shooting(
@@ -157,8 +248,8 @@ class GameClient:
         
         if should_shoot:
             # Calculate projectile starting position (center of player)
-            start_x = self.network_client.player_x + PLAYER_SIZE // 2
-            start_y = self.network_client.player_y + PLAYER_SIZE // 2
+            start_x = self.network_client.player_x + PLAYER_HALF_SIZE
+            start_y = self.network_client.player_y + PLAYER_HALF_SIZE
             
             # Send shoot command to server
             self.network_client.send_shoot(start_x, start_y, direction_x, direction_y)
@@ -175,33 +266,81 @@ class GameClient:
             self.projectile_manager.get_all_projectiles()
         )
     
+    def _simulation_steps(self, elapsed):
+        """
+        Return how many SIM_DT ticks to run for a frame that took elapsed seconds.
+        Every rendered frame runs at least one tick, so frames that finish slightly
+        early (clock.tick rounds to whole milliseconds) never stall movement; only
+        time beyond one tick accumulates, and is caught up on later frames.
+        """
+        accumulated = self._sim_accumulator + elapsed
+        steps = max(1, min(int(accumulated / SIM_DT), MAX_SIM_STEPS))
+        accumulated -= steps * SIM_DT
+        if accumulated < 0.0 or steps == MAX_SIM_STEPS:
+            accumulated = 0.0  # Never owe ticks; past the cap, drop the backlog
+        self._sim_accumulator = accumulated
+        return steps
+    
+    def _handle_event(self, event):
+        """Handle one queued event: window damage or a quit request."""
+        if event.type in REPAINT_EVENT_TYPES:
+            # Only dirty rects are normally pushed, so repaint everything
+            self.renderer.invalidate()
+            self._needs_redraw = True
+        elif self.input_handler.check_quit_input(event):
+            self.running = False
+    
     def run(self):
         """Main game loop."""
         if not self.connect_to_server():
             return
         
         self.running = True
+        self._sim_accumulator = 0.0
+        last_time = time.perf_counter()
         while self.running:
             for event in pygame.event.get():
-                if self.input_handler.check_quit_input(event):
-                    self.running = False
+                self._handle_event(event)
+            
+            now = time.perf_counter()
+            elapsed = now - last_time
+            last_time = now
             
             # Only handle input and draw if connected
             if self.network_client.connected:
-                self.handle_input()
-                self.check_collisions()  # Check for bullet collisions
-                self.draw()
+                self._process_projectile_events()
+                
+                # Step the simulation in fixed ticks, catching up after slow frames
+                keys = pygame.key.get_pressed()  # One keyboard snapshot per frame
+                for _ in range(self._simulation_steps(elapsed)):
+                    self.handle_input(keys)
+                    self.check_collisions()  # Check for bullet collisions
+                    self.frame_count += 1
+                
+                # Offer our position every frame; send_move() limits it to the network rate
+                self.network_client.send_move(self.network_client.player_x,
+                                              self.network_client.player_y)
+                self.network_client.flush()  # Send this frame's messages in one write
+                # Only redraw when something visible changed since the last frame
+                if self._needs_redraw:
+                    self._needs_redraw = False
+                    self.draw()
             else:
                 self.renderer.draw_disconnect_screen()
+                self._sim_accumulator = 0.0
+                # Nothing to simulate; sleep until an event arrives instead of ticking
+                self._handle_event(pygame.event.wait(DISCONNECTED_WAIT_MS))
+                last_time = time.perf_counter()
+                continue
             
-            # Update frame counter
-            self.frame_count += 1
-            self.clock.tick(FPS)
+            # Throttle while the window is in the background
+            self.clock.tick(FPS if pygame.key.get_focused() else UNFOCUSED_FPS)
         
         # Cleanup
         self.network_client.disconnect()
         pygame.quit()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
     client = GameClient()
     client.run()
\ No newline at end of file
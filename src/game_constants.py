@@ -8,7 +8,15 @@ HEIGHT = 600
 PLAYER_SIZE = 50
 PLAYER_HEIGHT = 50
 PLAYER_WIDTH = 50
+PLAYER_HALF_SIZE = PLAYER_SIZE // 2
 FPS = 60
+UNFOCUSED_FPS = 20  # frame cap while the window does not have input focus
+SIM_RATE = FPS  # fixed simulation ticks per second
+SIM_DT = 1.0 / SIM_RATE
+MAX_SIM_STEPS = 5  # max simulation ticks caught up in a single frame
+POSITION_SEND_RATE = 20  # position updates sent to the server per second
+POSITION_SEND_INTERVAL = 1.0 / POSITION_SEND_RATE
+DISCONNECTED_WAIT_MS = 100  # max time to block on events while disconnected
 
 # Colors
 WHITE = (255, 255, 255)
@@ -25,15 +33,18 @@ COLORS = {
 # Network settings
 DEFAULT_SERVER_HOST = 'localhost'
 DEFAULT_SERVER_PORT = 5555
+RECV_BUFFER_SIZE = 65536  # max bytes pulled from the socket per recv() call
 
 # Game settings
 PLAYER_SPEED = 5
 
 # Projectile settings
 PROJECTILE_SIZE = 5
+PROJECTILE_HALF_SIZE = PROJECTILE_SIZE // 2
 PROJECTILE_SPEED = 8
 PROJECTILE_LIFETIME = 120  # frames (2 seconds at 60 FPS)
 PROJECTILE_COLOR = (255, 255, 0)  # Yellow
+PROJECTILE_POOL_SIZE = 256  # max removed projectiles kept for reuse
 
 # Hitbox settings
 HITBOX_ENABLED = True  # Always show hitboxes
@@ -41,6 +52,10 @@ HITBOX_COLOR = (255, 0, 0)  # Red
 HITBOX_ALPHA = 0  # COMPLETELY TRANSPARENT
 HITBOX_SIZE = PLAYER_SIZE  # Same size as player
 
+# Collision settings
+COLLISION_GRID_CELL_SIZE = max(32, 2 * max(PLAYER_SIZE, PROJECTILE_SIZE))
+COLLISION_GRID_MIN_PLAYERS = 32  # below this many players, brute force is cheaper than the grid
+
 # Protocol messages
 MSG_WELCOME = "WELCOME"
 MSG_PLAYERS = "PLAYERS"
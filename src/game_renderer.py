@@ -12,83 +12,165 @@ class GameRenderer:
         self.font = pygame.font.Font(None, 24)
         self.status_font = pygame.font.Font(None, 36)
         
+        # Rendered label surfaces keyed by text (labels never change once rendered)
+        self._label_cache = {}
+        
+        # Pre-rendered projectile sprite, built on first use
+        self._projectile_surface = None
+        
+        # Screen regions drawn last frame; cleared and pushed to the display next frame
+        self._dirty_rects = []
+        self._full_redraw = True
+        
+        # Disconnect screen, rendered once on first use; flag is set while it is on screen
+        self._disconnect_surface = None
+        self._disconnect_shown = False
+        
+    def invalidate(self):
+        """Force the next draw to repaint and present the whole window."""
+        self._full_redraw = True
+        self._disconnect_shown = False
+    
     def draw_frame(self, player_x, player_y, player_color, player_id, other_players, connected, projectiles=None):
-        """Draw a complete game frame."""
-        self.screen.fill(BLACK)
+        """
+        Draw a complete game frame.
+        Only the regions covered by last frame's and this frame's drawings are
+        cleared and sent to the display, unless a full redraw is pending.
+        """
+        if self._full_redraw:
+            self.screen.fill(BLACK)
+        else:
+            # Erase everything drawn last frame; the rest of the screen is already black
+            for rect in self._dirty_rects:
+                self.screen.fill(BLACK, rect)
+        
+        dirty_rects = []
         
         # Draw other players
-        self._draw_other_players(other_players)
+        self._draw_other_players(other_players, dirty_rects)
         
         # Draw current player
-        self._draw_current_player(player_x, player_y, player_color)
+        self._draw_current_player(player_x, player_y, player_color, dirty_rects)
         
         # Draw projectiles
         if projectiles:
-            self._draw_projectiles(projectiles)
+            self._draw_projectiles(projectiles, dirty_rects)
         
         # Draw UI elements
-        self._draw_connection_status(connected, len(other_players) + 1)
+        self._draw_connection_status(connected, len(other_players) + 1, dirty_rects)
         
-        pygame.display.flip()
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(self._dirty_rects + dirty_rects)
+        self._dirty_rects = dirty_rects
+        self._disconnect_shown = False
     
-    def _draw_other_players(self, other_players):
+    def _draw_other_players(self, other_players, dirty_rects):
         """Draw all other players on the screen."""
+        labels = []
         for pid, player_data in other_players.items():
             color = COLORS.get(player_data['color'], WHITE)
-            pygame.draw.rect(self.screen, color, 
-                           (player_data['x'], player_data['y'], PLAYER_SIZE, PLAYER_SIZE))
+            dirty_rects.append(pygame.draw.rect(self.screen, color, 
+                           (player_data['x'], player_data['y'], PLAYER_SIZE, PLAYER_SIZE)))
             
-            # Draw player ID above square
-            text = self.font.render(pid, True, WHITE)
-            self.screen.blit(text, (player_data['x'], player_data['y'] - 20))
+            # Queue player ID above square
+            labels.append((self._get_label(pid), (player_data['x'], player_data['y'] - 20)))
+        
+        # Blit all player IDs in a single call
+        if labels:
+            dirty_rects.extend(self.screen.blits(labels))
     
-    def _draw_current_player(self, player_x, player_y, player_color):
+    def _draw_current_player(self, player_x, player_y, player_color, dirty_rects):
         """Draw the current player on the screen."""
         if player_color:
             color = COLORS.get(player_color, WHITE)
-            pygame.draw.rect(self.screen, color, 
-                           (player_x, player_y, PLAYER_SIZE, PLAYER_SIZE))
+            dirty_rects.append(pygame.draw.rect(self.screen, color, 
+                           (player_x, player_y, PLAYER_SIZE, PLAYER_SIZE)))
             
             # Draw "YOU" above current player
-            text = self.font.render("YOU", True, WHITE)
-            self.screen.blit(text, (player_x, player_y - 20))
+            text = self._get_label("YOU")
+            dirty_rects.append(self.screen.blit(text, (player_x, player_y - 20)))
+    
+    def _get_label(self, text):
+        """Return the rendered surface for a player label, rendering it only once."""
+        surface = self._label_cache.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, WHITE)
+            try:
+                # Match the display pixel format so every later blit takes the fast path
+                surface = surface.convert_alpha()
+            except pygame.error:
+                # Display not ready yet; don't cache so conversion is retried next time
+                return surface
+            self._label_cache[text] = surface
+        return surface
     
-    def _draw_projectiles(self, projectiles):
-        """Draw all projectiles on the screen."""
-        for projectile in projectiles.values():
-            pygame.draw.circle(self.screen, PROJECTILE_COLOR, 
-                             (int(projectile.x), int(projectile.y)), 
-                             PROJECTILE_SIZE // 2)
+    def _get_projectile_surface(self):
+        """Return the projectile sprite, drawing the circle only once."""
+        surface = self._projectile_surface
+        if surface is None:
+            radius = PROJECTILE_HALF_SIZE
+            surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(surface, PROJECTILE_COLOR, (radius, radius), radius)
+            try:
+                surface = surface.convert_alpha()
+            except pygame.error:
+                # Display not ready yet; don't cache so conversion is retried next time
+                return surface
+            self._projectile_surface = surface
+        return surface
     
-    def _draw_connection_status(self, connected, player_count):
+    def _draw_projectiles(self, projectiles, dirty_rects):
+        """Draw all projectiles on the screen in a single batched blit."""
+        surface = self._get_projectile_surface()
+        radius = PROJECTILE_HALF_SIZE
+        dirty_rects.extend(self.screen.blits(
+            [(surface, (int(projectile.x) - radius, int(projectile.y) - radius))
+             for projectile in projectiles.values()]
+        ))
+    
+    def _draw_connection_status(self, connected, player_count, dirty_rects):
         """Draw connection status and player count."""
         status_text = f"Connected: {connected} | Players: {player_count}"
         status_surface = self.status_font.render(status_text, True, WHITE)
-        self.screen.blit(status_surface, (10, 10))
+        dirty_rects.append(self.screen.blit(status_surface, (10, 10)))
     
-    def draw_disconnect_screen(self):
-        """Draw a screen when disconnected."""
-        self.screen.fill(BLACK)
+    def _build_disconnect_screen(self):
+        """Render the disconnected message screen onto its own surface."""
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        surface.fill(BLACK)
         
         # Draw disconnected message
         disconnect_text = self.status_font.render("Disconnected from server", True, WHITE)
         text_rect = disconnect_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-        self.screen.blit(disconnect_text, text_rect)
+        surface.blit(disconnect_text, text_rect)
         
         # Draw instructions
         instruction_text = self.font.render("Press ESC to quit", True, WHITE)
         instruction_rect = instruction_text.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 40))
-        self.screen.blit(instruction_text, instruction_rect)
-        
-        pygame.display.flip()
+        surface.blit(instruction_text, instruction_rect)
+        return surface
     
-    def draw_connecting_screen(self):
-        """Draw a screen while connecting to server."""
-        self.screen.fill(BLACK)
-        
-        # Draw connecting message
-        connecting_text = self.status_font.render("Connecting to server...", True, WHITE)
-        text_rect = connecting_text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
-        self.screen.blit(connecting_text, text_rect)
-        
-        pygame.display.flip()
\ No newline at end of file
+    def _get_disconnect_surface(self):
+        """Return the disconnect screen, rendering it only once."""
+        surface = self._disconnect_surface
+        if surface is None:
+            surface = self._build_disconnect_screen()
+            try:
+                surface = surface.convert()
+            except pygame.error:
+                # Display not ready yet; don't cache so conversion is retried next time
+                return surface
+            self._disconnect_surface = surface
+        return surface
+    
+    def draw_disconnect_screen(self):
+        """Draw a screen when disconnected; does nothing if it is already up."""
+        if self._disconnect_shown:
+            return
+        self.screen.blit(self._get_disconnect_surface(), (0, 0))
+        pygame.display.flip()
+        self._disconnect_shown = True
+        self._full_redraw = True
\ No newline at end of file
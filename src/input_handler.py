@@ -7,30 +7,54 @@ import math
 from game_constants import *
 
 
+def _build_move_lut():
+    """
+    Build a 256-entry table mapping packed movement-key bits to (dx, dy).
+    Bit layout: LEFT, a, RIGHT, d, UP, w, DOWN, s (bit 0 to bit 7).
+    """
+    lut = []
+    for index in range(256):
+        dx = dy = 0
+        if index & 0b00000011:  # LEFT or a
+            dx -= PLAYER_SPEED
+        if index & 0b00001100:  # RIGHT or d
+            dx += PLAYER_SPEED
+        if index & 0b00110000:  # UP or w
+            dy -= PLAYER_SPEED
+        if index & 0b11000000:  # DOWN or s
+            dy += PLAYER_SPEED
+        lut.append((dx, dy))
+    return tuple(lut)
+
+
+_MOVE_LUT = _build_move_lut()
+
+
 class InputHandler:
     def __init__(self):
-        self.keys_pressed = set()
         self.last_shot_time = 0
         self.shot_cooldown = 15  # frames between shots (4 shots per second at 60 FPS)
+        # Reused for the local player's collision checks instead of a new Rect per call
+        self._player_rect = pygame.Rect(0, 0, PLAYER_WIDTH, PLAYER_HEIGHT)
         
-    def handle_input(self, current_x, current_y, other_players):
+    def handle_input(self, current_x, current_y, other_players, keys=None):
         """
         Handle keyboard input and return new position.
+        keys is an optional pygame.key.get_pressed() snapshot; it is queried if omitted.
         Returns (new_x, new_y, moved) where moved indicates if position changed.
         """
-        keys = pygame.key.get_pressed()
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
-        new_x, new_y = current_x, current_y
+        # Pack the 8 movement key states into one byte and look up the offset
+        index = (keys[pygame.K_LEFT] | (keys[pygame.K_a] << 1) |
+                 (keys[pygame.K_RIGHT] << 2) | (keys[pygame.K_d] << 3) |
+                 (keys[pygame.K_UP] << 4) | (keys[pygame.K_w] << 5) |
+                 (keys[pygame.K_DOWN] << 6) | (keys[pygame.K_s] << 7))
+        dx, dy = _MOVE_LUT[index]
         
-        # Handle movement keys
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            new_x -= PLAYER_SPEED
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            new_x += PLAYER_SPEED
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            new_y -= PLAYER_SPEED
-        if keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            new_y += PLAYER_SPEED
+        new_x = current_x + dx
+        new_y = current_y + dy
         
         # Keep player within bounds
         new_x = max(0, min(WIDTH - PLAYER_SIZE, new_x))
@@ -51,17 +75,23 @@ class InputHandler:
         Check if the player would collide with any other player at position (x, y).
         Returns True if collision detected.
         """
-        from game_constants import PLAYER_WIDTH, PLAYER_HEIGHT
-        # Create rectangle for current player
-        player_rect = pygame.Rect(x, y, PLAYER_WIDTH, PLAYER_HEIGHT)
-
-        # Check collision with all other players
-        for pid, player_data in other_players.items():
-            other_rect = pygame.Rect(player_data['x'], player_data['y'], PLAYER_WIDTH, PLAYER_HEIGHT)
-            if player_rect.colliderect(other_rect):
-                return True
+        # Gather rects of nearby players only
+        nearby_rects = []
+        for player_data in other_players.values():
+            # Cheap reject: players too far apart on either axis can't overlap
+            # (one pixel of slack covers Rect truncating float coordinates)
+            if (abs(player_data['x'] - x) >= PLAYER_WIDTH + 1
+                    or abs(player_data['y'] - y) >= PLAYER_HEIGHT + 1):
+                continue
+            nearby_rects.append(pygame.Rect(player_data['x'], player_data['y'], PLAYER_WIDTH, PLAYER_HEIGHT))
         
-        return False
+        if not nearby_rects:
+            return False
+        
+        # Test all candidates in one call
+        player_rect = self._player_rect
+        player_rect.update(x, y, PLAYER_WIDTH, PLAYER_HEIGHT)
+        return player_rect.collidelist(nearby_rects) != -1
     
     def check_quit_input(self, event):
         """Check if user wants to quit the game."""
@@ -81,26 +111,25 @@ class InputHandler:
         Check for mouse clicks and return shooting information.
         Returns (should_shoot, target_x, target_y, direction_x, direction_y)
         """
-        mouse_buttons = pygame.mouse.get_pressed()
-        
         # Check if enough time has passed since last shot
         if current_frame - self.last_shot_time < self.shot_cooldown:
             return False, 0, 0, 0, 0
         
-        if mouse_buttons[0]:  # Left mouse button
+        if pygame.mouse.get_pressed()[0]:  # Left mouse button
             mouse_x, mouse_y = pygame.mouse.get_pos()
             
             # Calculate player center
-            player_center_x = player_x + PLAYER_SIZE // 2
-            player_center_y = player_y + PLAYER_SIZE // 2
+            player_center_x = player_x + PLAYER_HALF_SIZE
+            player_center_y = player_y + PLAYER_HALF_SIZE
             
             # Calculate direction from player to mouse
             dx = mouse_x - player_center_x
             dy = mouse_y - player_center_y
             
-            # Normalize direction
-            distance = math.sqrt(dx * dx + dy * dy)
-            if distance > 0:
+            # Normalize direction (skip a zero-length aim vector)
+            distance_sq = dx * dx + dy * dy
+            if distance_sq > 0:
+                distance = math.sqrt(distance_sq)
                 direction_x = dx / distance
                 direction_y = dy / distance
                 
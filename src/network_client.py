@@ -2,10 +2,14 @@
 Network client module for handling server communication in the multiplayer game.
 """
 
+import logging
 import socket
 import threading
+import time
 from game_constants import *
 
+log = logging.getLogger(__name__)
+
 
 class NetworkClient:
     def __init__(self, host=DEFAULT_SERVER_HOST, port=DEFAULT_SERVER_PORT):
@@ -14,14 +18,23 @@ class NetworkClient:
         self.socket = None
         self.connected = False
         
+        # Outgoing messages queued during a frame and sent together by flush()
+        self._out_buffer = bytearray()
+        
         # Player data received from server
         self.player_id = None
         self.player_x = 0
         self.player_y = 0
         self.player_color = None
+        # Last position the server was told about, to skip redundant MOVE messages
+        self._last_sent_position = None
+        # Earliest perf_counter() time the next MOVE may be sent
+        self._next_move_time = 0.0
         
         # Other players data
         self.other_players = {}
+        # Bumped whenever other_players changes, so consumers can skip rebuilding derived data
+        self.players_version = 0
         
         # Callback functions for handling events
         self.on_welcome = None
@@ -32,6 +45,17 @@ class NetworkClient:
         self.on_projectile_update = None
         self.on_projectile_remove = None
         
+        # Message type -> handler; each handler gets the payload after "TYPE:"
+        self._message_handlers = {
+            MSG_WELCOME: self._handle_welcome_message,
+            MSG_PLAYERS: self._handle_players_message,
+            MSG_UPDATE: self._handle_update_message,
+            MSG_NEW_PLAYER: self._handle_new_player_message,
+            MSG_PLAYER_LEFT: self._handle_player_left_message,
+            MSG_PROJECTILE_UPDATE: self._handle_projectile_update_message,
+            MSG_PROJECTILE_REMOVE: self._handle_projectile_remove_message,
+        }
+        
     def set_callbacks(self, on_welcome=None, on_player_update=None, 
                      on_new_player=None, on_player_left=None, on_disconnect=None,
                      on_projectile_update=None, on_projectile_remove=None):
@@ -56,11 +80,11 @@ class NetworkClient:
             listen_thread.daemon = True
             listen_thread.start()
             
-            print("Connected to server successfully!")
+            log.info("Connected to server successfully!")
             return True
             
         except Exception as e:
-            print(f"Failed to connect to server: {e}")
+            log.error("Failed to connect to server: %s", e)
             return False
     
     def disconnect(self):
@@ -68,6 +92,7 @@ class NetworkClient:
         if self.connected:
             try:
                 self.send_message(MSG_DISCONNECT)
+                self.flush()
                 self.socket.close()
             except:
                 pass
@@ -76,10 +101,22 @@ class NetworkClient:
                 self.on_disconnect()
     
     def send_move(self, x, y):
-        """Send player movement to server."""
+        """
+        Send player movement to server, at most POSITION_SEND_RATE times per second
+        and only if the server does not already have this position.
+        Call it every frame; a position held back is sent once the interval has passed.
+        """
         if self.connected and self.player_id:
+            position = (x, y)
+            if position == self._last_sent_position:
+                return
+            now = time.perf_counter()
+            if now < self._next_move_time:
+                return
             message = f"{MSG_MOVE}:{self.player_id}:{x}:{y}"
             self.send_message(message)
+            self._last_sent_position = position
+            self._next_move_time = now + POSITION_SEND_INTERVAL
     
     def send_shoot(self, start_x, start_y, direction_x, direction_y):
         """Send projectile shooting to server."""
@@ -93,74 +130,92 @@ class NetworkClient:
             message = f"{MSG_HIT}:{victim_id}:{shooter_id}:{projectile_id}"
             self.send_message(message)
     
+    def send_hits(self, hits):
+        """Queue hit notifications for a list of (victim_id, shooter_id, projectile_id)."""
+        if hits and self.connected and self.player_id:
+            lines = ''.join(f"{MSG_HIT}:{victim_id}:{shooter_id}:{projectile_id}\n"
+                            for victim_id, shooter_id, projectile_id in hits)
+            self._out_buffer += lines.encode('utf-8')
+    
     def send_message(self, message):
-        """Send a message to the server."""
+        """Queue a message for the server; it is sent on the next flush()."""
+        if self.connected:
+            self._out_buffer += (message + '\n').encode('utf-8')
+    
+    def flush(self):
+        """Send all queued messages to the server in a single write."""
+        data = self._out_buffer
+        if not data:
+            return
+        self._out_buffer = bytearray()
         if self.connected:
             try:
-                self.socket.send((message + '\n').encode('utf-8'))
+                self.socket.sendall(data)
             except Exception as e:
-                print(f"Error sending message: {e}")
+                log.error("Error sending message: %s", e)
                 self.connected = False
     
     def _listen_to_server(self):
         """Listen for messages from the server (runs in separate thread)."""
+        # Raw bytes received but not yet parsed; may end with a partial message
+        buffer = bytearray()
         while self.connected:
             try:
-                data = self.socket.recv(1024).decode('utf-8')
+                data = self.socket.recv(RECV_BUFFER_SIZE)
                 if not data:
                     break
-                    
-                # Handle multiple messages in one packet
-                messages = data.split('\n')
-                for message in messages:
-                    if message.strip():
-                        self._handle_server_message(message.strip())
+                buffer += data
+                
+                # Cut off every complete message in one pass; keep the partial tail
+                end = buffer.rfind(b'\n')
+                if end < 0:
+                    continue
+                lines = buffer[:end].split(b'\n')
+                del buffer[:end + 1]
+                
+                for line in lines:
+                    message = line.decode('utf-8', 'replace').strip()
+                    if message:
+                        self._handle_server_message(message)
                 
             except Exception as e:
-                print(f"Error receiving data: {e}")
+                log.error("Error receiving data: %s", e)
                 break
         
         self.connected = False
-        print("Disconnected from server")
+        log.info("Disconnected from server")
         if self.on_disconnect:
             self.on_disconnect()
     
     def _handle_server_message(self, message):
         """Handle incoming message from server."""
-        print(f"Received: {message}")  # Debug print
+        log.debug("Received: %s", message)
         
-        if message.startswith(f"{MSG_WELCOME}:"):
-            self._handle_welcome_message(message)
-        elif message.startswith(f"{MSG_PLAYERS}:"):
-            self._handle_players_message(message)
-        elif message.startswith(f"{MSG_UPDATE}:"):
-            self._handle_update_message(message)
-        elif message.startswith(f"{MSG_NEW_PLAYER}:"):
-            self._handle_new_player_message(message)
-        elif message.startswith(f"{MSG_PLAYER_LEFT}:"):
-            self._handle_player_left_message(message)
-        elif message.startswith(f"{MSG_PROJECTILE_UPDATE}:"):
-            self._handle_projectile_update_message(message)
-        elif message.startswith(f"{MSG_PROJECTILE_REMOVE}:"):
-            self._handle_projectile_remove_message(message)
-    
-    def _handle_welcome_message(self, message):
+        msg_type, separator, payload = message.partition(':')
+        if not separator:
+            return
+        handler = self._message_handlers.get(msg_type)
+        if handler:
+            handler(payload)
+    
+    def _handle_welcome_message(self, payload):
         """Handle welcome message from server."""
         # Format: WELCOME:playerId:x:y:color
-        parts = message.split(":")
-        if len(parts) >= 5:
-            self.player_id = parts[1]
-            self.player_x = int(parts[2])
-            self.player_y = int(parts[3])
-            self.player_color = parts[4]
-            print(f"Welcome! You are {self.player_id} with color {self.player_color}")
+        parts = payload.split(":")
+        if len(parts) >= 4:
+            self.player_id = parts[0]
+            self.player_x = int(parts[1])
+            self.player_y = int(parts[2])
+            self.player_color = parts[3]
+            # The server chose this spawn position, so it is already up to date
+            self._last_sent_position = (self.player_x, self.player_y)
+            log.info("Welcome! You are %s with color %s", self.player_id, self.player_color)
             if self.on_welcome:
                 self.on_welcome(self.player_id, self.player_x, self.player_y, self.player_color)
     
-    def _handle_players_message(self, message):
+    def _handle_players_message(self, players_data):
         """Handle players list message from server."""
         # Format: PLAYERS:player1,x1,y1,color1;player2,x2,y2,color2;...
-        players_data = message[len(f"{MSG_PLAYERS}:"):]  # Remove "PLAYERS:"
         self.other_players.clear()
         
         if players_data:
@@ -177,77 +232,86 @@ class NetworkClient:
                                 'y': int(y),
                                 'color': color
                             }
+        self.players_version += 1
         
-        print(f"Updated player list: {list(self.other_players.keys())}")
+        log.debug("Updated player list: %s", list(self.other_players))
         if self.on_player_update:
             self.on_player_update(self.other_players)
     
-    def _handle_update_message(self, message):
+    def _handle_update_message(self, payload):
         """Handle player position update message."""
         # Format: UPDATE:playerId:x:y
-        parts = message.split(":")
-        if len(parts) >= 4:
-            pid, x, y = parts[1], parts[2], parts[3]
-            if pid in self.other_players:
-                self.other_players[pid]['x'] = int(x)
-                self.other_players[pid]['y'] = int(y)
+        # Most frequent message; partition avoids building a list per update
+        pid, _, coords = payload.partition(":")
+        x, separator, y = coords.partition(":")
+        y = y.partition(":")[0]  # Ignore any trailing fields
+        if separator:
+            player = self.other_players.get(pid)
+            if player is not None:
+                x, y = int(x), int(y)
+                if player['x'] == x and player['y'] == y:
+                    return  # Nothing moved; keep derived data and the frame as they are
+                player['x'] = x
+                player['y'] = y
+                self.players_version += 1
                 if self.on_player_update:
                     self.on_player_update(self.other_players)
     
-    def _handle_new_player_message(self, message):
+    def _handle_new_player_message(self, payload):
         """Handle new player joined message."""
         # Format: NEW_PLAYER:playerId:x:y:color
-        parts = message.split(":")
-        if len(parts) >= 5:
-            pid, x, y, color = parts[1], parts[2], parts[3], parts[4]
+        parts = payload.split(":")
+        if len(parts) >= 4:
+            pid, x, y, color = parts[0], parts[1], parts[2], parts[3]
             if pid != self.player_id:
                 self.other_players[pid] = {
                     'x': int(x),
                     'y': int(y),
                     'color': color
                 }
-                print(f"New player joined: {pid}")
+                self.players_version += 1
+                log.info("New player joined: %s", pid)
                 if self.on_new_player:
                     self.on_new_player(pid, x, y, color)
                 if self.on_player_update:
                     self.on_player_update(self.other_players)
     
-    def _handle_player_left_message(self, message):
+    def _handle_player_left_message(self, payload):
         """Handle player left message."""
         # Format: PLAYER_LEFT:playerId
-        pid = message.split(":")[1]
+        pid = payload.split(":")[0]
         if pid in self.other_players:
             del self.other_players[pid]
-            print(f"Player left: {pid}")
+            self.players_version += 1
+            log.info("Player left: %s", pid)
             if self.on_player_left:
                 self.on_player_left(pid)
             if self.on_player_update:
                 self.on_player_update(self.other_players)
     
-    def _handle_projectile_update_message(self, message):
+    def _handle_projectile_update_message(self, payload):
         """Handle projectile update message."""
         # Format: PROJECTILE_UPDATE:projectileId:x:y:directionX:directionY:ownerId
-        parts = message.split(":")
-        if len(parts) >= 7:
+        # maxsplit keeps any trailing fields out of ownerId
+        parts = payload.split(":", 6)
+        if len(parts) >= 6:
             projectile_data = {
-                'id': parts[1],
-                'x': float(parts[2]),
-                'y': float(parts[3]),
-                'direction_x': float(parts[4]),
-                'direction_y': float(parts[5]),
-                'owner_id': parts[6]
+                'id': parts[0],
+                'x': float(parts[1]),
+                'y': float(parts[2]),
+                'direction_x': float(parts[3]),
+                'direction_y': float(parts[4]),
+                'owner_id': parts[5]
             }
             if self.on_projectile_update:
                 self.on_projectile_update(projectile_data)
     
-    def _handle_projectile_remove_message(self, message):
+    def _handle_projectile_remove_message(self, payload):
         """Handle projectile removal message."""
         # Format: PROJECTILE_REMOVE:projectileId
-        parts = message.split(":")
-        if len(parts) >= 2:
-            projectile_id = parts[1]
-            if self.on_projectile_remove:
-                self.on_projectile_remove(projectile_id)
+        projectile_id = payload.split(":")[0]
+        if self.on_projectile_remove:
+            self.on_projectile_remove(projectile_id)
     
     def get_player_count(self):
         """Get total number of players (including self)."""
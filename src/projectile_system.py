@@ -7,7 +7,15 @@ from game_constants import *
 
 
 class Projectile:
+    # Fixed attribute set: many projectiles are alive at once and read every frame
+    __slots__ = ('id', 'x', 'y', 'direction_x', 'direction_y', 'owner_id',
+                 'lifetime')
+    
     def __init__(self, projectile_id, x, y, direction_x, direction_y, owner_id):
+        self.reset(projectile_id, x, y, direction_x, direction_y, owner_id)
+        
+    def reset(self, projectile_id, x, y, direction_x, direction_y, owner_id):
+        """Re-initialize all fields so a pooled instance can be reused for a new shot."""
         self.id = projectile_id
         self.x = x
         self.y = y
@@ -31,8 +39,8 @@ class Projectile:
         
     def get_rect(self):
         """Get the projectile's collision rectangle."""
-        return (self.x - PROJECTILE_SIZE // 2, 
-                self.y - PROJECTILE_SIZE // 2,
+        return (self.x - PROJECTILE_HALF_SIZE, 
+                self.y - PROJECTILE_HALF_SIZE,
                 PROJECTILE_SIZE, 
                 PROJECTILE_SIZE)
 
@@ -41,14 +49,35 @@ class ProjectileManager:
     def __init__(self):
         self.projectiles = {}  # projectile_id -> Projectile
         self.next_projectile_id = 0
+        self._free_projectiles = []  # removed projectiles kept for reuse
+        
+    def _acquire_projectile(self, projectile_id, x, y, direction_x, direction_y, owner_id):
+        """Get a projectile from the free list, or allocate one if it is empty."""
+        if self._free_projectiles:
+            projectile = self._free_projectiles.pop()
+            projectile.reset(projectile_id, x, y, direction_x, direction_y, owner_id)
+            return projectile
+        return Projectile(projectile_id, x, y, direction_x, direction_y, owner_id)
+    
+    def _release_projectile(self, projectile):
+        """Return a removed projectile to the free list, up to the pool size."""
+        if len(self._free_projectiles) < PROJECTILE_POOL_SIZE:
+            self._free_projectiles.append(projectile)
         
     def create_projectile(self, start_x, start_y, direction_x, direction_y, owner_id):
         """Create a new projectile."""
         projectile_id = f"{owner_id}_{self.next_projectile_id}"
         self.next_projectile_id += 1
         
-        projectile = Projectile(projectile_id, start_x, start_y, 
-                              direction_x, direction_y, owner_id)
+        projectile = self._acquire_projectile(projectile_id, start_x, start_y, 
+                                              direction_x, direction_y, owner_id)
+        self.projectiles[projectile_id] = projectile
+        return projectile
+    
+    def add_projectile(self, projectile_id, x, y, direction_x, direction_y, owner_id):
+        """Add a projectile with an externally assigned id (e.g. from the server)."""
+        projectile = self._acquire_projectile(projectile_id, x, y, 
+                                              direction_x, direction_y, owner_id)
         self.projectiles[projectile_id] = projectile
         return projectile
         
@@ -62,14 +91,15 @@ class ProjectileManager:
                 
         # Remove expired projectiles
         for projectile_id in expired_projectiles:
-            del self.projectiles[projectile_id]
+            self._release_projectile(self.projectiles.pop(projectile_id))
             
         return expired_projectiles
         
     def remove_projectile(self, projectile_id):
         """Remove a specific projectile."""
-        if projectile_id in self.projectiles:
-            del self.projectiles[projectile_id]
+        projectile = self.projectiles.pop(projectile_id, None)
+        if projectile is not None:
+            self._release_projectile(projectile)
             
     def get_all_projectiles(self):
         """Get all active projectiles."""
@@ -79,7 +109,7 @@ class ProjectileManager:
         """Remove all projectiles owned by a specific player."""
         to_remove = [pid for pid, p in self.projectiles.items() if p.owner_id == owner_id]
         for pid in to_remove:
-            del self.projectiles[pid]
+            self._release_projectile(self.projectiles.pop(pid))
         return to_remove
     
     class Projectile:
@@ -0,0 +1,56 @@
+"""
+Spatial hash grid for broad-phase collision queries between projectiles and players.
+"""
+
+
+class SpatialHashGrid:
+    def __init__(self, cell_size):
+        self.cell_size = cell_size
+        self.cells = {}  # (cell_x, cell_y) -> list of objects
+        self._spare_buckets = []  # emptied bucket lists reused across frames
+        
+    def clear(self):
+        """Empty the grid, keeping bucket lists around for reuse."""
+        for bucket in self.cells.values():
+            bucket.clear()
+            self._spare_buckets.append(bucket)
+        self.cells.clear()
+        
+    def _cell_range(self, x, y, width, height):
+        """Get the inclusive cell index range covered by an AABB."""
+        size = self.cell_size
+        return (int(x // size), int((x + width) // size),
+                int(y // size), int((y + height) // size))
+        
+    def insert(self, x, y, width, height, obj):
+        """Insert an object into every cell its AABB overlaps."""
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(x, y, width, height)
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    bucket = self._spare_buckets.pop() if self._spare_buckets else []
+                    cells[(cx, cy)] = bucket
+                bucket.append(obj)
+                
+    def query(self, x, y, width, height):
+        """
+        Get the objects sharing at least one cell with the given AABB.
+        Returns a list without duplicates; callers still run the exact test.
+        """
+        min_cx, max_cx, min_cy, max_cy = self._cell_range(x, y, width, height)
+        cells = self.cells
+        
+        # Fast path: the AABB sits inside a single cell
+        if min_cx == max_cx and min_cy == max_cy:
+            return list(cells.get((min_cx, min_cy), ()))
+        
+        found = {}
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for obj in bucket:
+                        found[obj] = True
+        return list(found)
@@ -76,10 +76,21 @@ def mock_pygame():
             self.top = y
             self.bottom = y + height
         
+        def update(self, x, y, width, height):
+            """Move and resize the rect in place."""
+            self.__init__(x, y, width, height)
+        
         def colliderect(self, other):
             """Check collision with another rect using AABB."""
             return (self.left < other.right and self.right > other.left and
                     self.top < other.bottom and self.bottom > other.top)
+        
+        def collidelist(self, rects):
+            """Return the index of the first colliding rect, or -1."""
+            for i, other in enumerate(rects):
+                if self.colliderect(other):
+                    return i
+            return -1
     
     mock_pg.Rect = MockRect
     
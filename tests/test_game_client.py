@@ -0,0 +1,227 @@
+"""
+Unit tests for the game client's per-frame logic.
+Tests simulation stepping, collision checks, window events and how projectile
+events from the network thread are applied, using the mocked Pygame.
+"""
+
+import pytest
+import sys
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@pytest.fixture
+def game_client(mock_pygame):
+    """Fixture providing a GameClient whose local player is 'me' at (0, 0)."""
+    from game_client import GameClient
+    client = GameClient()
+    client.network_client.player_id = 'me'
+    client.network_client.player_x = 0
+    client.network_client.player_y = 0
+    client.network_client.send_hits = MagicMock()
+    return client
+
+
+def projectile_data(projectile_id, x, y, owner_id):
+    """Build the dict NetworkClient passes to on_projectile_update."""
+    return {'id': projectile_id, 'x': x, 'y': y,
+            'direction_x': 1.0, 'direction_y': 0.0, 'owner_id': owner_id}
+
+
+class TestProjectileEvents:
+    """Test that network projectile events only touch the pool on the main thread."""
+    
+    def test_network_callbacks_are_queued_not_applied(self, game_client):
+        """Test that projectile callbacks leave the manager alone until events are processed."""
+        game_client._on_projectile_update(projectile_data('p2_1', 100.0, 100.0, 'p2'))
+        
+        assert game_client.projectile_manager.projectiles == {}
+        
+        game_client._process_projectile_events()
+        
+        projectile = game_client.projectile_manager.projectiles['p2_1']
+        assert (projectile.x, projectile.y, projectile.owner_id) == (100.0, 100.0, 'p2')
+    
+    def test_removed_projectile_is_not_recycled_before_processing(self, game_client):
+        """Test that a removal plus a new spawn leave the held instance intact until processed."""
+        game_client._on_projectile_update(projectile_data('p2_1', 100.0, 100.0, 'p2'))
+        game_client._process_projectile_events()
+        held = game_client.projectile_manager.projectiles['p2_1']
+        
+        # Network thread retires p2_1 and spawns p3_1 while the main thread holds p2_1
+        game_client._on_projectile_remove('p2_1')
+        game_client._on_projectile_update(projectile_data('p3_1', 500.0, 500.0, 'p3'))
+        
+        assert (held.id, held.x, held.y, held.owner_id) == ('p2_1', 100.0, 100.0, 'p2')
+        
+        game_client._process_projectile_events()
+        
+        assert 'p2_1' not in game_client.projectile_manager.projectiles
+        assert game_client.projectile_manager.projectiles['p3_1'].owner_id == 'p3'
+
+
+def add_player(client, player_id, x, y):
+    """Add a remote player the way NetworkClient does, bumping players_version."""
+    client.network_client._handle_server_message(f"NEW_PLAYER:{player_id}:{x}:{y}:red")
+
+
+def reported_hits(client):
+    """Return the hits passed to send_hits() by the last check_collisions(), sorted."""
+    if not client.network_client.send_hits.called:
+        return []
+    return sorted(client.network_client.send_hits.call_args[0][0])
+
+
+class TestCollisionChecks:
+    """Test projectile-vs-player hits and the cached player entries they use."""
+    
+    def test_player_moving_between_checks_moves_the_hit(self, game_client):
+        """Test that an UPDATE between two checks is seen by the second check."""
+        add_player(game_client, 'p2', 400, 400)
+        game_client.projectile_manager.add_projectile('me_1', 125.0, 125.0, 1.0, 0.0, 'me')
+        
+        game_client.check_collisions()
+        assert reported_hits(game_client) == [], "Projectile is far from p2"
+        
+        game_client.network_client._handle_server_message("UPDATE:p2:100:100")
+        game_client.check_collisions()
+        
+        assert reported_hits(game_client) == [('p2', 'me', 'me_1')]
+    
+    def test_unchanged_players_reuse_entries(self, game_client):
+        """Test that entries are not rebuilt when players_version has not changed."""
+        add_player(game_client, 'p2', 400, 400)
+        game_client.check_collisions()
+        entries = game_client._player_entries
+        
+        game_client.check_collisions()
+        
+        assert game_client._player_entries is entries
+    
+    def test_grid_and_brute_force_report_the_same_hits(self, game_client, monkeypatch):
+        """Test that the spatial grid path finds exactly the hits the plain loop finds."""
+        import game_client as game_client_module
+        from game_client import GameClient
+        
+        def run_checks(client):
+            client.network_client.player_id = 'me'
+            client.network_client.send_hits = MagicMock()
+            for i in range(40):
+                add_player(client, f'p{i}', (i % 15) * 52, (i // 15) * 60 + 100)
+            add_projectile = client.projectile_manager.add_projectile
+            add_projectile('me_1', 5 * 52 + 25, 125.0, 1.0, 0.0, 'me')   # inside p5
+            add_projectile('me_2', 5 * 52 + 25, 185.0, 1.0, 0.0, 'me')   # inside p20
+            add_projectile('me_3', 790.0, 590.0, 1.0, 0.0, 'me')         # hits nobody
+            add_projectile('p1_1', 10.0, 10.0, 1.0, 0.0, 'p1')           # hits me
+            client.check_collisions()
+            return reported_hits(client)
+        
+        grid_hits = run_checks(game_client)
+        monkeypatch.setattr(game_client_module, 'COLLISION_GRID_MIN_PLAYERS', 10 ** 6)
+        brute_force_hits = run_checks(GameClient())
+        
+        assert grid_hits == brute_force_hits
+        assert grid_hits == [('me', 'p1', 'p1_1'), ('p20', 'me', 'me_2'), ('p5', 'me', 'me_1')]
+
+
+class TestWindowEvents:
+    """Test that window damage forces a full repaint."""
+    
+    def test_expose_event_forces_full_redraw(self, game_client, mock_pygame):
+        """Test that WINDOWEXPOSED schedules a draw that repaints the whole window."""
+        game_client.renderer._full_redraw = False
+        game_client._needs_redraw = False
+        
+        game_client._handle_event(MagicMock(type=mock_pygame.WINDOWEXPOSED))
+        
+        assert game_client._needs_redraw is True
+        assert game_client.renderer._full_redraw is True
+        assert game_client.running is True, "Expose must not be treated as quit"
+    
+    def test_expose_event_reshows_static_screen(self, game_client, mock_pygame):
+        """Test that an exposed disconnect screen is blitted and flipped again."""
+        game_client.renderer.draw_disconnect_screen()
+        mock_pygame.display.flip.reset_mock()
+        
+        game_client._handle_event(MagicMock(type=mock_pygame.VIDEOEXPOSE))
+        game_client.renderer.draw_disconnect_screen()
+        
+        mock_pygame.display.flip.assert_called_once()
+    
+    def test_escape_key_still_quits(self, game_client, mock_pygame):
+        """Test that ESC keeps working through the shared event handler."""
+        game_client._handle_event(MagicMock(type=mock_pygame.KEYDOWN, key=mock_pygame.K_ESCAPE))
+        
+        assert game_client.running is False
+
+
+def run_frames(client, monkeypatch, frame_times):
+    """
+    Drive client.run() with a fake clock, one frame per entry in frame_times
+    (seconds each frame takes), and return the simulation steps run per frame.
+    """
+    import game_client as game_client_module
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(game_client_module, 'time', SimpleNamespace(perf_counter=lambda: clock.now))
+    
+    client.connect_to_server = MagicMock(return_value=True)
+    client.network_client.connected = True
+    client.network_client.disconnect = MagicMock()
+    client.network_client.flush = MagicMock()
+    client.network_client.send_move = MagicMock()
+    client.handle_input = MagicMock()
+    client.check_collisions = MagicMock()
+    client.draw = MagicMock()
+    
+    steps_per_frame = []
+    remaining = list(frame_times)
+    
+    def tick(framerate):
+        steps_per_frame.append(client.handle_input.call_count - sum(steps_per_frame))
+        if remaining:
+            clock.now += remaining.pop(0)
+        else:
+            client.running = False
+    
+    client.clock = MagicMock()
+    client.clock.tick.side_effect = tick
+    client.run()
+    return steps_per_frame
+
+
+class TestSimulationStepping:
+    """Test that run() steps the fixed-rate simulation smoothly."""
+    
+    def test_every_frame_steps_when_clock_runs_slightly_fast(self, game_client, monkeypatch):
+        """Test that 16 ms frames (clock.tick(60) rounding) run exactly one tick each."""
+        steps = run_frames(game_client, monkeypatch, [0.016] * 100)
+        
+        assert steps == [1] * 101, "No frame may skip the simulation"
+    
+    def test_slow_frame_catches_up(self, game_client, monkeypatch):
+        """Test that a frame taking two ticks' time runs two ticks, then returns to one."""
+        from game_constants import SIM_DT
+        
+        steps = run_frames(game_client, monkeypatch, [SIM_DT * 2.5, SIM_DT, SIM_DT])
+        
+        assert steps[1:] == [2, 1, 1]
+    
+    def test_long_stall_is_capped_and_dropped(self, game_client, monkeypatch):
+        """Test that a one-second stall runs at most MAX_SIM_STEPS and drops the backlog."""
+        from game_constants import MAX_SIM_STEPS
+        
+        steps = run_frames(game_client, monkeypatch, [1.0, 0.016, 0.016])
+        
+        assert steps[1:] == [MAX_SIM_STEPS, 1, 1]
+    
+    def test_unfocused_frame_rate_keeps_simulation_speed(self, game_client, monkeypatch):
+        """Test that 20 FPS frames still run about SIM_RATE ticks per second."""
+        from game_constants import SIM_RATE
+        
+        steps = run_frames(game_client, monkeypatch, [0.05] * 20)
+        
+        assert SIM_RATE - 1 <= sum(steps[1:]) <= SIM_RATE
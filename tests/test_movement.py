@@ -123,6 +123,90 @@ class TestBasicMovement:
         assert new_x == current_x, "X position should not change"
         assert new_y == current_y, "Y position should not change"
         assert moved is False, "Movement flag should be False"
+    
+    def test_opposing_keys_cancel_out(self, input_handler, mock_pygame):
+        """Test that pressing LEFT and RIGHT together results in no horizontal movement."""
+        # Set up opposing key presses
+        mock_pygame._key_array.set_keys({
+            mock_pygame.K_RIGHT: True,
+            mock_pygame.K_LEFT: True,
+            mock_pygame.K_UP: False,
+            mock_pygame.K_DOWN: False,
+            mock_pygame.K_a: False,
+            mock_pygame.K_d: False,
+            mock_pygame.K_w: False,
+            mock_pygame.K_s: False
+        })
+        
+        # Initial position
+        current_x, current_y = 400, 300
+        other_players = {}
+        
+        # Handle input
+        new_x, new_y, moved = input_handler.handle_input(current_x, current_y, other_players)
+        
+        # Assertions
+        assert new_x == current_x, "Opposing keys should cancel out"
+        assert new_y == current_y, "Y position should not change"
+        assert moved is False, "Movement flag should be False"
+    
+    def test_arrow_and_wasd_same_direction_do_not_stack(self, input_handler, mock_pygame):
+        """Test that pressing DOWN and 'S' together moves by PLAYER_SPEED only once."""
+        from game_constants import PLAYER_SPEED
+        
+        # Set up both keys for the same direction
+        mock_pygame._key_array.set_keys({
+            mock_pygame.K_RIGHT: False,
+            mock_pygame.K_LEFT: False,
+            mock_pygame.K_UP: False,
+            mock_pygame.K_DOWN: True,
+            mock_pygame.K_a: False,
+            mock_pygame.K_d: False,
+            mock_pygame.K_w: False,
+            mock_pygame.K_s: True
+        })
+        
+        # Initial position
+        current_x, current_y = 400, 300
+        other_players = {}
+        
+        # Handle input
+        new_x, new_y, moved = input_handler.handle_input(current_x, current_y, other_players)
+        
+        # Assertions
+        assert new_x == current_x, "X position should not change"
+        assert new_y == current_y + PLAYER_SPEED, f"Expected y to increase by {PLAYER_SPEED} only"
+        assert moved is True, "Movement flag should be True"
+    
+    def test_uses_provided_key_snapshot(self, input_handler, mock_pygame):
+        """Test that a passed-in key snapshot is used instead of querying pygame."""
+        from game_constants import PLAYER_SPEED
+        
+        # Snapshot with only 'd' held, taken once per frame by the caller
+        keys = {
+            mock_pygame.K_RIGHT: False,
+            mock_pygame.K_LEFT: False,
+            mock_pygame.K_UP: False,
+            mock_pygame.K_DOWN: False,
+            mock_pygame.K_a: False,
+            mock_pygame.K_d: True,
+            mock_pygame.K_w: False,
+            mock_pygame.K_s: False
+        }
+        mock_pygame.key.get_pressed.reset_mock()
+        
+        # Initial position
+        current_x, current_y = 400, 300
+        other_players = {}
+        
+        # Handle input with the snapshot
+        new_x, new_y, moved = input_handler.handle_input(current_x, current_y, other_players, keys)
+        
+        # Assertions
+        assert new_x == current_x + PLAYER_SPEED, f"Expected x to increase by {PLAYER_SPEED}"
+        assert new_y == current_y, "Y position should not change"
+        assert moved is True, "Movement flag should be True"
+        mock_pygame.key.get_pressed.assert_not_called()
 
 
 class TestBoundaryEnforcement:
@@ -0,0 +1,182 @@
+"""
+Unit tests for the network client.
+Tests outgoing message batching and incoming message framing using a fake socket
+(no server required).
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+@pytest.fixture
+def network_client():
+    """Fixture providing a NetworkClient that looks connected, backed by a fake socket."""
+    from network_client import NetworkClient
+    client = NetworkClient()
+    client.socket = MagicMock()
+    client.connected = True
+    client.player_id = 'player_1'
+    return client
+
+
+class TestOutgoingBatching:
+    """Test that outgoing messages are queued and sent in one write per flush."""
+    
+    def test_messages_are_queued_until_flush(self, network_client):
+        """Test that send_move() does not write to the socket by itself."""
+        network_client.send_move(10, 20)
+        
+        network_client.socket.sendall.assert_not_called()
+    
+    def test_flush_sends_all_messages_in_one_write(self, network_client):
+        """Test that flush() writes every queued message, newline-terminated, in one call."""
+        network_client.send_move(10, 20)
+        network_client.send_shoot(35, 45, 1.0, 0.0)
+        network_client.send_hit('player_2', 'player_1', 'player_1_3')
+        
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_called_once_with(
+            b"MOVE:player_1:10:20\n"
+            b"SHOOT:player_1:35:45:1.0:0.0\n"
+            b"HIT:player_2:player_1:player_1_3\n"
+        )
+    
+    def test_send_hits_queues_every_hit(self, network_client):
+        """Test that send_hits() queues one HIT line per reported hit."""
+        network_client.send_hits([
+            ('player_2', 'player_1', 'player_1_3'),
+            ('player_3', 'player_1', 'player_1_4'),
+        ])
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_called_once_with(
+            b"HIT:player_2:player_1:player_1_3\n"
+            b"HIT:player_3:player_1:player_1_4\n"
+        )
+    
+    def test_flush_with_empty_queue_does_not_write(self, network_client):
+        """Test that flush() skips the socket when nothing was queued."""
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_not_called()
+
+
+class TestMoveDeduplication:
+    """Test that unchanged positions are not re-sent to the server."""
+    
+    def test_same_position_is_sent_once(self, network_client):
+        """Test that repeating send_move() with the same position queues one MOVE."""
+        network_client.send_move(10, 20)
+        network_client.send_move(10, 20)
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_called_once_with(b"MOVE:player_1:10:20\n")
+    
+    def test_spawn_position_from_welcome_is_not_echoed(self, network_client):
+        """Test that the WELCOME spawn position counts as already sent."""
+        network_client._handle_server_message("WELCOME:player_1:100:200:red")
+        network_client.send_move(100, 200)
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_not_called()
+
+
+class TestMoveRateLimit:
+    """Test that MOVE messages are limited to POSITION_SEND_RATE per second."""
+    
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Fake perf_counter for the network client; set clock.now to move time."""
+        from types import SimpleNamespace
+        import network_client as network_client_module
+        fake = SimpleNamespace(now=100.0)
+        monkeypatch.setattr(network_client_module, 'time', SimpleNamespace(perf_counter=lambda: fake.now))
+        return fake
+    
+    def test_moves_within_interval_send_one_move(self, network_client, clock):
+        """Test that new positions inside POSITION_SEND_INTERVAL produce a single MOVE."""
+        from game_constants import POSITION_SEND_INTERVAL
+        
+        network_client.send_move(10, 20)
+        clock.now += POSITION_SEND_INTERVAL / 3
+        network_client.send_move(15, 20)
+        clock.now += POSITION_SEND_INTERVAL / 3
+        network_client.send_move(20, 20)
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_called_once_with(b"MOVE:player_1:10:20\n")
+    
+    def test_held_back_position_is_sent_after_interval(self, network_client, clock):
+        """Test that the latest position goes out once the interval has passed."""
+        from game_constants import POSITION_SEND_INTERVAL
+        
+        network_client.send_move(10, 20)
+        clock.now += POSITION_SEND_INTERVAL / 2
+        network_client.send_move(15, 20)
+        clock.now += POSITION_SEND_INTERVAL
+        network_client.send_move(15, 20)
+        network_client.flush()
+        
+        network_client.socket.sendall.assert_called_once_with(
+            b"MOVE:player_1:10:20\n"
+            b"MOVE:player_1:15:20\n"
+        )
+
+
+class TestIncomingMessages:
+    """Test that the receive loop splits the byte stream into whole messages."""
+    
+    def test_message_split_across_reads_is_reassembled(self, network_client):
+        """Test that a message cut between two recv() calls is handled once, intact."""
+        network_client.other_players = {
+            'player_2': {'x': 0, 'y': 0, 'color': 'red'},
+            'player_3': {'x': 0, 'y': 0, 'color': 'blue'},
+        }
+        network_client.socket.recv.side_effect = [
+            b"UPDATE:player_2:1",
+            b"0:20\nPLAYER_LEFT:player_3\n",
+            b"",  # Server closed the connection
+        ]
+        
+        network_client._listen_to_server()
+        
+        assert network_client.other_players == {'player_2': {'x': 10, 'y': 20, 'color': 'red'}}
+        assert network_client.connected is False, "Closed connection should disconnect"
+    
+    def test_update_to_same_position_is_ignored(self, network_client):
+        """Test that an UPDATE repeating a player's position does not mark players as changed."""
+        network_client.other_players = {'player_2': {'x': 10, 'y': 20, 'color': 'red'}}
+        version = network_client.players_version
+        
+        network_client._handle_server_message("UPDATE:player_2:10:20")
+        
+        assert network_client.players_version == version
+    
+    def test_update_ignores_trailing_fields(self, network_client):
+        """Test that extra fields after x:y are ignored rather than breaking the parse."""
+        network_client.other_players = {'player_2': {'x': 0, 'y': 0, 'color': 'red'}}
+        
+        network_client._handle_server_message("UPDATE:player_2:10:20:extra")
+        
+        assert network_client.other_players['player_2'] == {'x': 10, 'y': 20, 'color': 'red'}
+    
+    def test_projectile_update_is_parsed(self, network_client):
+        """Test that PROJECTILE_UPDATE fields reach the callback, ignoring trailing fields."""
+        received = []
+        network_client.on_projectile_update = received.append
+        
+        network_client._handle_server_message("PROJECTILE_UPDATE:player_1_3:12.5:40.0:0.6:-0.8:player_1")
+        network_client._handle_server_message("PROJECTILE_UPDATE:player_1_4:1.0:2.0:1.0:0.0:player_1:extra")
+        
+        assert received == [
+            {'id': 'player_1_3', 'x': 12.5, 'y': 40.0,
+             'direction_x': 0.6, 'direction_y': -0.8, 'owner_id': 'player_1'},
+            {'id': 'player_1_4', 'x': 1.0, 'y': 2.0,
+             'direction_x': 1.0, 'direction_y': 0.0, 'owner_id': 'player_1'},
+        ]
@@ -0,0 +1,90 @@
+"""
+Unit tests for projectile lifecycle in the ProjectileManager.
+Tests creation, movement, expiry, and reuse of pooled projectile instances.
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class TestProjectileLifecycle:
+    """Test projectile creation, movement and removal."""
+    
+    def test_projectile_moves_by_speed_along_direction(self):
+        """Test that update() moves a projectile PROJECTILE_SPEED along its direction."""
+        from projectile_system import ProjectileManager
+        from game_constants import PROJECTILE_SPEED
+        
+        manager = ProjectileManager()
+        projectile = manager.create_projectile(100, 100, 1.0, 0.0, 'player1')
+        
+        # Advance one frame
+        expired = manager.update_projectiles()
+        
+        assert expired == [], "Projectile inside the screen should not expire"
+        assert projectile.x == 100 + PROJECTILE_SPEED, f"Expected x to increase by {PROJECTILE_SPEED}"
+        assert projectile.y == 100, "Y position should not change"
+    
+    def test_projectile_expires_when_leaving_screen(self):
+        """Test that a projectile leaving the screen is removed by update_projectiles()."""
+        from projectile_system import ProjectileManager
+        
+        manager = ProjectileManager()
+        projectile = manager.create_projectile(2, 100, -1.0, 0.0, 'player1')
+        
+        # Advance one frame - moves past the left edge
+        expired = manager.update_projectiles()
+        
+        assert expired == [projectile.id], "Projectile past the left edge should expire"
+        assert projectile.id not in manager.get_all_projectiles()
+
+
+class TestProjectilePooling:
+    """Test that removed projectiles are reused instead of reallocated."""
+    
+    def test_removed_projectile_is_reused(self):
+        """Test that creating a projectile after a removal reuses the removed instance."""
+        from projectile_system import ProjectileManager
+        
+        manager = ProjectileManager()
+        first = manager.create_projectile(100, 100, 1.0, 0.0, 'player1')
+        manager.remove_projectile(first.id)
+        
+        second = manager.create_projectile(300, 200, 0.0, 1.0, 'player2')
+        
+        assert second is first, "Removed projectile instance should be reused"
+        assert second.id == 'player2_1', "Reused projectile should get the new id"
+        assert (second.x, second.y) == (300, 200), "Reused projectile should be reset to new position"
+        assert second.owner_id == 'player2', "Reused projectile should be reset to new owner"
+    
+    def test_pool_size_is_capped(self):
+        """Test that the free list never grows beyond PROJECTILE_POOL_SIZE."""
+        from projectile_system import ProjectileManager
+        from game_constants import PROJECTILE_POOL_SIZE
+        
+        manager = ProjectileManager()
+        for _ in range(PROJECTILE_POOL_SIZE + 10):
+            manager.create_projectile(100, 100, 1.0, 0.0, 'player1')
+        
+        # Remove everything at once
+        removed = manager.clear_projectiles_by_owner('player1')
+        
+        assert len(removed) == PROJECTILE_POOL_SIZE + 10
+        assert len(manager._free_projectiles) == PROJECTILE_POOL_SIZE, "Free list should be capped"
+    
+    def test_server_projectile_reuses_pooled_instance(self):
+        """Test that add_projectile() keeps the server id and reuses a removed instance."""
+        from projectile_system import ProjectileManager
+        
+        manager = ProjectileManager()
+        first = manager.add_projectile('player1_7', 100, 100, 1.0, 0.0, 'player1')
+        manager.remove_projectile('player1_7')
+        
+        second = manager.add_projectile('player2_8', 50, 60, 0.0, -1.0, 'player2')
+        
+        assert second is first, "Removed projectile instance should be reused"
+        assert manager.get_all_projectiles() == {'player2_8': second}, "Server id should be kept"
@@ -0,0 +1,71 @@
+"""
+Unit tests for the spatial hash grid used in the collision broad phase.
+Tests cell bucketing, multi-cell objects, and bucket reuse across frames.
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+
+class TestSpatialHashGrid:
+    """Test insertion and querying of the spatial hash grid."""
+    
+    def test_query_finds_object_in_same_cell(self):
+        """Test that an AABB query returns objects inserted in the same cell."""
+        from spatial_hash import SpatialHashGrid
+        
+        grid = SpatialHashGrid(100)
+        grid.insert(10, 10, 50, 50, 'player2')
+        
+        # Query a small box inside the player
+        candidates = grid.query(20, 20, 5, 5)
+        
+        assert candidates == ['player2'], "Object in the same cell should be returned"
+    
+    def test_query_skips_objects_in_distant_cells(self):
+        """Test that objects far away from the query box are not returned."""
+        from spatial_hash import SpatialHashGrid
+        
+        grid = SpatialHashGrid(100)
+        grid.insert(10, 10, 50, 50, 'player2')
+        grid.insert(600, 400, 50, 50, 'player3')
+        
+        # Query near player3 only
+        candidates = grid.query(610, 410, 5, 5)
+        
+        assert candidates == ['player3'], "Only the nearby object should be returned"
+    
+    def test_object_spanning_cells_is_returned_once(self):
+        """Test that an object straddling several cells is reported only once."""
+        from spatial_hash import SpatialHashGrid
+        
+        grid = SpatialHashGrid(100)
+        # Straddles the corner shared by four cells
+        grid.insert(80, 80, 50, 50, 'player2')
+        
+        # Query box also straddles all four cells
+        candidates = grid.query(90, 90, 30, 30)
+        
+        assert candidates == ['player2'], "Object should not be duplicated across cells"
+    
+    def test_clear_empties_grid_and_reuses_buckets(self):
+        """Test that clear() removes all objects and keeps bucket lists for reuse."""
+        from spatial_hash import SpatialHashGrid
+        
+        grid = SpatialHashGrid(100)
+        grid.insert(10, 10, 50, 50, 'player2')
+        bucket = grid.cells[(0, 0)]
+        
+        grid.clear()
+        
+        assert grid.query(10, 10, 50, 50) == [], "Grid should be empty after clear"
+        
+        # Next insert picks the emptied bucket back up
+        grid.insert(10, 10, 50, 50, 'player3')
+        
+        assert grid.cells[(0, 0)] is bucket, "Bucket list should be reused after clear"
+        assert grid.query(10, 10, 50, 50) == ['player3']